@@ -2,7 +2,6 @@
 # -*- coding: utf-8 -*-
 import os
 import sys
-import json
 import tempfile
 import time
 import subprocess
@@ -28,6 +27,10 @@ logger = logging.getLogger(__name__)
 Path(config.TEMP_DIR).mkdir(parents=True, exist_ok=True)
 Path(config.RESULTS_DIR).mkdir(parents=True, exist_ok=True)
 
+# Result file readers are shared with the other bots (jshunter/results.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from jshunter.results import latest_result_files, read_result_files, result_suffix
+
 # Helper functions for the enhanced jshunter
 def run_jshunter_scan(url: str) -> list[dict]:
     """Run jshunter scan on a URL and return results."""
@@ -35,6 +38,8 @@ def run_jshunter_scan(url: str) -> list[dict]:
         result = subprocess.run([
             "python3", "../cli/jshunter", 
             "--high-performance", 
+            "--compress", "gzip",
+            "--full-findings",
             "-u", url
         ], capture_output=True, text=True, timeout=120, cwd=Path(__file__).parent)
         
@@ -49,34 +54,26 @@ def run_jshunter_scan(url: str) -> list[dict]:
             return []
         
         # Find the most recent verified and unverified result files
-        verified_files = list(results_dir.glob("verified_results_*.json"))
-        unverified_files = list(results_dir.glob("unverified_results_*.json"))
+        verified_files = latest_result_files(results_dir, "verified")
+        unverified_files = latest_result_files(results_dir, "unverified")
         
         findings = []
         
         # Read verified findings
         if verified_files:
-            latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
             try:
-                with open(latest_verified, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            finding = json.loads(line.strip())
-                            finding["Verified"] = True
-                            findings.append(finding)
+                for finding in read_result_files(verified_files):
+                    finding["Verified"] = True
+                    findings.append(finding)
             except Exception as e:
                 logger.error(f"Error reading verified results: {e}")
         
         # Read unverified findings
         if unverified_files:
-            latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
             try:
-                with open(latest_unverified, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            finding = json.loads(line.strip())
-                            finding["Verified"] = False
-                            findings.append(finding)
+                for finding in read_result_files(unverified_files):
+                    finding["Verified"] = False
+                    findings.append(finding)
             except Exception as e:
                 logger.error(f"Error reading unverified results: {e}")
         
@@ -88,21 +85,14 @@ def run_jshunter_scan(url: str) -> list[dict]:
 def run_jshunter_file_scan(file_path: str) -> list[dict]:
     """Run jshunter scan on a local file and return results."""
     try:
-        # Create temporary URL file for the local file
-        temp_url_file = Path(config.TEMP_DIR) / f"file_{int(time.time())}.txt"
-        with open(temp_url_file, 'w') as f:
-            f.write(f"file://{file_path}")
-        
         result = subprocess.run([
             "python3", "../cli/jshunter", 
             "--high-performance", 
-            "-f", str(temp_url_file)
+            "--compress", "gzip",
+            "--full-findings",
+            "--path", str(file_path)
         ], capture_output=True, text=True, timeout=120, cwd=Path(__file__).parent)
         
-        # Cleanup temp URL file
-        if temp_url_file.exists():
-            temp_url_file.unlink()
-        
         if result.returncode != 0:
             logger.error(f"JSHunter file scan failed: {result.stderr}")
             return []
@@ -114,34 +104,26 @@ def run_jshunter_file_scan(file_path: str) -> list[dict]:
             return []
         
         # Find the most recent verified and unverified result files
-        verified_files = list(results_dir.glob("verified_results_*.json"))
-        unverified_files = list(results_dir.glob("unverified_results_*.json"))
+        verified_files = latest_result_files(results_dir, "verified")
+        unverified_files = latest_result_files(results_dir, "unverified")
         
         findings = []
         
         # Read verified findings
         if verified_files:
-            latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
             try:
-                with open(latest_verified, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            finding = json.loads(line.strip())
-                            finding["Verified"] = True
-                            findings.append(finding)
+                for finding in read_result_files(verified_files):
+                    finding["Verified"] = True
+                    findings.append(finding)
             except Exception as e:
                 logger.error(f"Error reading verified results: {e}")
         
         # Read unverified findings
         if unverified_files:
-            latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
             try:
-                with open(latest_unverified, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            finding = json.loads(line.strip())
-                            finding["Verified"] = False
-                            findings.append(finding)
+                for finding in read_result_files(unverified_files):
+                    finding["Verified"] = False
+                    findings.append(finding)
             except Exception as e:
                 logger.error(f"Error reading unverified results: {e}")
         
@@ -375,22 +357,22 @@ async def scan_command(ctx):
             # Send detailed results files if any found
             if findings:
                 results_dir = Path(__file__).parent.parent / "cli" / "results"
-                verified_files = list(results_dir.glob("verified_results_*.json"))
-                unverified_files = list(results_dir.glob("unverified_results_*.json"))
+                verified_files = latest_result_files(results_dir, "verified")
+                unverified_files = latest_result_files(results_dir, "unverified")
                 
                 if verified_files:
-                    latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
-                    await ctx.send(
-                        "📄 Verified findings:",
-                        file=discord.File(latest_verified, filename=f"verified_findings_{int(time.time())}.json")
-                    )
+                    for part in verified_files:
+                        await ctx.send(
+                            "📄 Verified findings:",
+                            file=discord.File(part, filename=f"verified_findings_{int(time.time())}{result_suffix(part)}")
+                        )
                 
                 if unverified_files:
-                    latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
-                    await ctx.send(
-                        "📄 Unverified findings:",
-                        file=discord.File(latest_unverified, filename=f"unverified_findings_{int(time.time())}.json")
-                    )
+                    for part in unverified_files:
+                        await ctx.send(
+                            "📄 Unverified findings:",
+                            file=discord.File(part, filename=f"unverified_findings_{int(time.time())}{result_suffix(part)}")
+                        )
         
         except Exception as e:
             logger.error(f"Error processing file: {e}", exc_info=True)
@@ -545,22 +527,22 @@ async def scanurl_command(ctx, url: str = None):
         # Send detailed results files if findings exist
         if findings:
             results_dir = Path(__file__).parent.parent / "cli" / "results"
-            verified_files = list(results_dir.glob("verified_results_*.json"))
-            unverified_files = list(results_dir.glob("unverified_results_*.json"))
+            verified_files = latest_result_files(results_dir, "verified")
+            unverified_files = latest_result_files(results_dir, "unverified")
             
             if verified_files:
-                latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
-                await ctx.send(
-                    "📄 Verified findings:",
-                    file=discord.File(latest_verified, filename=f"verified_findings_{int(time.time())}.json")
-                )
+                for part in verified_files:
+                    await ctx.send(
+                        "📄 Verified findings:",
+                        file=discord.File(part, filename=f"verified_findings_{int(time.time())}{result_suffix(part)}")
+                    )
             
             if unverified_files:
-                latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
-                await ctx.send(
-                    "📄 Unverified findings:",
-                    file=discord.File(latest_unverified, filename=f"unverified_findings_{int(time.time())}.json")
-                )
+                for part in unverified_files:
+                    await ctx.send(
+                        "📄 Unverified findings:",
+                        file=discord.File(part, filename=f"unverified_findings_{int(time.time())}{result_suffix(part)}")
+                    )
         
         # Cleanup - no temp files to clean up for URL scanning
             
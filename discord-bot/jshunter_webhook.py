@@ -2,7 +2,6 @@
 # -*- coding: utf-8 -*-
 import os
 import sys
-import json
 import tempfile
 import time
 import subprocess
@@ -26,6 +25,10 @@ logger = logging.getLogger(__name__)
 Path(config.TEMP_DIR).mkdir(parents=True, exist_ok=True)
 Path(config.RESULTS_DIR).mkdir(parents=True, exist_ok=True)
 
+# Result file readers are shared with the other bots (jshunter/results.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from jshunter.results import latest_result_files, read_result_files
+
 # Helper functions for the enhanced jshunter
 def run_jshunter_scan(url: str) -> list[dict]:
     """Run jshunter scan on a URL and return results."""
@@ -33,6 +36,8 @@ def run_jshunter_scan(url: str) -> list[dict]:
         result = subprocess.run([
             "python3", "../cli/jshunter", 
             "--high-performance", 
+            "--compress", "gzip",
+            "--full-findings",
             "-u", url
         ], capture_output=True, text=True, timeout=120, cwd=Path(__file__).parent)
         
@@ -47,34 +52,26 @@ def run_jshunter_scan(url: str) -> list[dict]:
             return []
         
         # Find the most recent verified and unverified result files
-        verified_files = list(results_dir.glob("verified_results_*.json"))
-        unverified_files = list(results_dir.glob("unverified_results_*.json"))
+        verified_files = latest_result_files(results_dir, "verified")
+        unverified_files = latest_result_files(results_dir, "unverified")
         
         findings = []
         
         # Read verified findings
         if verified_files:
-            latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
             try:
-                with open(latest_verified, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            finding = json.loads(line.strip())
-                            finding["Verified"] = True
-                            findings.append(finding)
+                for finding in read_result_files(verified_files):
+                    finding["Verified"] = True
+                    findings.append(finding)
             except Exception as e:
                 logger.error(f"Error reading verified results: {e}")
         
         # Read unverified findings
         if unverified_files:
-            latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
             try:
-                with open(latest_unverified, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            finding = json.loads(line.strip())
-                            finding["Verified"] = False
-                            findings.append(finding)
+                for finding in read_result_files(unverified_files):
+                    finding["Verified"] = False
+                    findings.append(finding)
             except Exception as e:
                 logger.error(f"Error reading unverified results: {e}")
         
@@ -92,7 +89,8 @@ def send_webhook_message(content: str, files: list = None):
             # Send files with message
             files_data = []
             for file_path in files:
-                files_data.append(('file', (file_path.name, open(file_path, 'rb'), 'application/json')))
+                mime = 'application/gzip' if file_path.suffix == '.gz' else 'application/json'
+                files_data.append(('file', (file_path.name, open(file_path, 'rb'), mime)))
             
             data = {
                 'content': content
@@ -173,18 +171,16 @@ def scan_url(url: str):
             
             # Send result files
             results_dir = Path(__file__).parent.parent / "cli" / "results"
-            verified_files = list(results_dir.glob("verified_results_*.json"))
-            unverified_files = list(results_dir.glob("unverified_results_*.json"))
+            verified_files = latest_result_files(results_dir, "verified")
+            unverified_files = latest_result_files(results_dir, "unverified")
             
             files_to_send = []
             
             if verified_files:
-                latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
-                files_to_send.append(latest_verified)
+                files_to_send.extend(verified_files)
             
             if unverified_files:
-                latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
-                files_to_send.append(latest_unverified)
+                files_to_send.extend(unverified_files)
             
             if files_to_send:
                 send_webhook_message("📄 **Detailed Results Files:**", files_to_send)
@@ -0,0 +1,65 @@
+# JSHunter result file readers, shared by the Discord and Telegram bots
+#
+# Result files are NDJSON, optionally gzip (.gz) or zstd (.zst) compressed, and
+# may be rotated into parts listed in a ``*.manifest.json``. Only the standard
+# library is needed; reading .zst files requires the zstandard package.
+import gzip
+import io
+import json
+import re
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+def latest_result_files(results_dir: Path, kind: str) -> list[Path]:
+    """Return the result files ("verified"/"unverified") of the most recent jshunter run, in part order.
+
+    A rotated run is read through its manifest; otherwise its parts are found by name.
+    """
+    results_dir = Path(results_dir)
+    runs = {}
+    for path in results_dir.glob(f"{kind}_results_*"):
+        m = re.match(rf"{kind}_results_(\d+)\.(?:part(\d+)\.)?json(?:\.gz|\.zst)?$", path.name)
+        if m:
+            runs.setdefault(int(m.group(1)), []).append((int(m.group(2) or 1), path))
+    if not runs:
+        return []
+    latest = max(runs)
+    manifest = results_dir / f"{kind}_results_{latest}.manifest.json"
+    if manifest.exists():
+        with open(manifest, "r", encoding="utf-8") as f:
+            return [results_dir / part["path"] for part in json.load(f).get("parts", [])]
+    return [path for _, path in sorted(runs[latest])]
+
+def open_result_text(path: Path):
+    """Open a plain, .gz or .zst NDJSON result file for reading as text."""
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError("reading .zst results requires the 'zstandard' package")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True, read_across_frames=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+def read_result_files(paths: list[Path]) -> list[dict]:
+    """Read findings from NDJSON result files, decompressing transparently."""
+    findings = []
+    for path in paths:
+        with open_result_text(path) as f:
+            for line in f:
+                if line.strip():
+                    findings.append(json.loads(line))
+    return findings
+
+def result_suffix(path: Path) -> str:
+    """Suffix of a result file after its run timestamp, e.g. '.part2.json.gz'."""
+    return "." + Path(path).name.split(".", 1)[1]
+
+def result_format(path: Path) -> str:
+    """Human-readable format of a result file, e.g. 'gzip-compressed NDJSON'."""
+    return {".gz": "gzip-compressed NDJSON", ".zst": "zstd-compressed NDJSON"}.get(Path(path).suffix, "NDJSON")
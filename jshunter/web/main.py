@@ -65,21 +65,12 @@ def run_jshunter_scan(url: str) -> List[Dict]:
 def run_jshunter_file_scan(file_path: str) -> List[Dict]:
     """Run jshunter scan on a local file and return results."""
     try:
-        # Create a temporary URL file
-        temp_url_file = f"/tmp/url_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        with open(temp_url_file, 'w') as f:
-            f.write(f"file://{file_path}")
-        
         result = subprocess.run([
             "python3", "jshunter/cli/jshunter", 
             "--high-performance", 
-            "-f", temp_url_file
+            "--path", file_path
         ], capture_output=True, text=True, timeout=60)
         
-        # Cleanup
-        if os.path.exists(temp_url_file):
-            os.remove(temp_url_file)
-        
         if result.returncode != 0:
             return []
         
@@ -7,7 +7,6 @@ from pathlib import Path
 import logging
 from typing import Optional
 import tempfile
-import json
 import requests
 import re
 import subprocess
@@ -28,6 +27,10 @@ logger = logging.getLogger(__name__)
 Path(config.TEMP_DIR).mkdir(parents=True, exist_ok=True)
 Path(config.RESULTS_DIR).mkdir(parents=True, exist_ok=True)
 
+# Result file readers are shared with the other bots (jshunter/results.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from jshunter.results import latest_result_files, read_result_files, result_format
+
 # Helper functions for the enhanced jshunter
 def run_jshunter_scan(url: str) -> list[dict]:
     """Run jshunter scan on a URL and return results."""
@@ -35,6 +38,8 @@ def run_jshunter_scan(url: str) -> list[dict]:
         result = subprocess.run([
             "python3", "../cli/jshunter", 
             "--high-performance", 
+            "--compress", "gzip",
+            "--full-findings",
             "-u", url
         ], capture_output=True, text=True, timeout=120, cwd=Path(__file__).parent)
         
@@ -49,34 +54,26 @@ def run_jshunter_scan(url: str) -> list[dict]:
             return []
         
         # Find the most recent verified and unverified result files
-        verified_files = list(results_dir.glob("verified_results_*.json"))
-        unverified_files = list(results_dir.glob("unverified_results_*.json"))
+        verified_files = latest_result_files(results_dir, "verified")
+        unverified_files = latest_result_files(results_dir, "unverified")
         
         findings = []
         
         # Read verified findings
         if verified_files:
-            latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
             try:
-                with open(latest_verified, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            finding = json.loads(line.strip())
-                            finding["Verified"] = True
-                            findings.append(finding)
+                for finding in read_result_files(verified_files):
+                    finding["Verified"] = True
+                    findings.append(finding)
             except Exception as e:
                 logger.error(f"Error reading verified results: {e}")
         
         # Read unverified findings
         if unverified_files:
-            latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
             try:
-                with open(latest_unverified, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            finding = json.loads(line.strip())
-                            finding["Verified"] = False
-                            findings.append(finding)
+                for finding in read_result_files(unverified_files):
+                    finding["Verified"] = False
+                    findings.append(finding)
             except Exception as e:
                 logger.error(f"Error reading unverified results: {e}")
         
@@ -97,6 +94,8 @@ def run_jshunter_batch_scan(urls: list[str]) -> dict:
         result = subprocess.run([
             "python3", "../cli/jshunter", 
             "--high-performance", 
+            "--compress", "gzip",
+            "--full-findings",
             "-f", str(temp_url_file)
         ], capture_output=True, text=True, timeout=300, cwd=Path(__file__).parent)
         
@@ -115,34 +114,26 @@ def run_jshunter_batch_scan(urls: list[str]) -> dict:
             return {"success": True, "findings": []}
         
         # Find the most recent verified and unverified result files
-        verified_files = list(results_dir.glob("verified_results_*.json"))
-        unverified_files = list(results_dir.glob("unverified_results_*.json"))
+        verified_files = latest_result_files(results_dir, "verified")
+        unverified_files = latest_result_files(results_dir, "unverified")
         
         findings = []
         
         # Read verified findings
         if verified_files:
-            latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
             try:
-                with open(latest_verified, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            finding = json.loads(line.strip())
-                            finding["Verified"] = True
-                            findings.append(finding)
+                for finding in read_result_files(verified_files):
+                    finding["Verified"] = True
+                    findings.append(finding)
             except Exception as e:
                 logger.error(f"Error reading verified results: {e}")
         
         # Read unverified findings
         if unverified_files:
-            latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
             try:
-                with open(latest_unverified, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            finding = json.loads(line.strip())
-                            finding["Verified"] = False
-                            findings.append(finding)
+                for finding in read_result_files(unverified_files):
+                    finding["Verified"] = False
+                    findings.append(finding)
             except Exception as e:
                 logger.error(f"Error reading unverified results: {e}")
         
@@ -239,22 +230,22 @@ async def scanurl_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             
             # Send detailed results files
             results_dir = Path(__file__).parent.parent / "cli" / "results"
-            verified_files = list(results_dir.glob("verified_results_*.json"))
-            unverified_files = list(results_dir.glob("unverified_results_*.json"))
+            verified_files = latest_result_files(results_dir, "verified")
+            unverified_files = latest_result_files(results_dir, "unverified")
             
             if verified_files:
-                latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
-                await update.message.reply_document(
-                    document=latest_verified,
-                    caption="📄 Verified findings (JSON format)"
-                )
+                for part in verified_files:
+                    await update.message.reply_document(
+                        document=part,
+                        caption=f"📄 Verified findings ({result_format(part)})"
+                    )
             
             if unverified_files:
-                latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
-                await update.message.reply_document(
-                    document=latest_unverified,
-                    caption="📄 Unverified findings (JSON format)"
-                )
+                for part in unverified_files:
+                    await update.message.reply_document(
+                        document=part,
+                        caption=f"📄 Unverified findings ({result_format(part)})"
+                    )
         else:
             await update.message.reply_text(f"✅ No secrets found in {url}")
         
@@ -483,21 +474,14 @@ async def handle_file(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
             # Scan the file using jshunter
             await update.message.reply_text("🚀 Scanning file with high-performance mode...")
             
-            # Create temporary URL file for the local file
-            temp_url_file = Path(config.TEMP_DIR) / f"file_{int(time.time())}.txt"
-            with open(temp_url_file, 'w') as f:
-                f.write(f"file://{file_path}")
-            
             result = subprocess.run([
                 "python3", "../cli/jshunter", 
                 "--high-performance", 
-                "-f", str(temp_url_file)
+                "--compress", "gzip",
+                "--full-findings",
+                "--path", str(file_path)
             ], capture_output=True, text=True, timeout=120, cwd=Path(__file__).parent)
             
-            # Cleanup temp URL file
-            if temp_url_file.exists():
-                temp_url_file.unlink()
-            
             if result.returncode != 0:
                 await update.message.reply_text(f"❌ Scan failed: {result.stderr}")
                 return
@@ -509,32 +493,24 @@ async def handle_file(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
             
             if results_dir.exists():
                 # Find the most recent verified and unverified result files
-                verified_files = list(results_dir.glob("verified_results_*.json"))
-                unverified_files = list(results_dir.glob("unverified_results_*.json"))
+                verified_files = latest_result_files(results_dir, "verified")
+                unverified_files = latest_result_files(results_dir, "unverified")
                 
                 # Read verified findings
                 if verified_files:
-                    latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
                     try:
-                        with open(latest_verified, 'r') as f:
-                            for line in f:
-                                if line.strip():
-                                    finding = json.loads(line.strip())
-                                    finding["Verified"] = True
-                                    findings.append(finding)
+                        for finding in read_result_files(verified_files):
+                            finding["Verified"] = True
+                            findings.append(finding)
                     except Exception as e:
                         logger.error(f"Error reading verified results: {e}")
                 
                 # Read unverified findings
                 if unverified_files:
-                    latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
                     try:
-                        with open(latest_unverified, 'r') as f:
-                            for line in f:
-                                if line.strip():
-                                    finding = json.loads(line.strip())
-                                    finding["Verified"] = False
-                                    findings.append(finding)
+                        for finding in read_result_files(unverified_files):
+                            finding["Verified"] = False
+                            findings.append(finding)
                     except Exception as e:
                         logger.error(f"Error reading unverified results: {e}")
             
@@ -545,22 +521,22 @@ async def handle_file(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
             # Save results if any found
             if findings:
                 results_dir = Path(__file__).parent.parent / "cli" / "results"
-                verified_files = list(results_dir.glob("verified_results_*.json"))
-                unverified_files = list(results_dir.glob("unverified_results_*.json"))
+                verified_files = latest_result_files(results_dir, "verified")
+                unverified_files = latest_result_files(results_dir, "unverified")
                 
                 if verified_files:
-                    latest_verified = max(verified_files, key=lambda x: x.stat().st_mtime)
-                    await update.message.reply_document(
-                        document=latest_verified,
-                        caption="📄 Verified findings (JSON format)"
-                    )
+                    for part in verified_files:
+                        await update.message.reply_document(
+                            document=part,
+                            caption=f"📄 Verified findings ({result_format(part)})"
+                        )
                 
                 if unverified_files:
-                    latest_unverified = max(unverified_files, key=lambda x: x.stat().st_mtime)
-                    await update.message.reply_document(
-                        document=latest_unverified,
-                        caption="📄 Unverified findings (JSON format)"
-                    )
+                    for part in unverified_files:
+                        await update.message.reply_document(
+                            document=part,
+                            caption=f"📄 Unverified findings ({result_format(part)})"
+                        )
         
         except Exception as e:
             logger.error(f"Error processing file: {e}", exc_info=True)